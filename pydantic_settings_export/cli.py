@@ -4,7 +4,7 @@ import sys
 from collections.abc import Sequence
 from inspect import isclass
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 from dotenv import dotenv_values
 
@@ -70,7 +70,8 @@ parser.add_argument(
     type=file_type,
     help="Path to `pyproject.toml` file. (default: ./pyproject.toml)",
 )
-parser.add_argument(
+# Keep the action, so `main` can import the generators after the arguments are parsed
+generator_action = parser.add_argument(
     "--generator",
     "-g",
     default=AbstractGenerator.ALL_GENERATORS,
@@ -97,6 +98,7 @@ parser.add_argument(
 
 def main(parse_args: Sequence[str] | None = None):  # noqa: D103
     args: argparse.Namespace = parser.parse_args(parse_args)
+    cast(GeneratorAction, generator_action).resolve(parser, args)
     if args.env_file:
         os.environ.update(dotenv_values(stream=args.env_file))
 
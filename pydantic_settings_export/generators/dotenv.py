@@ -2,7 +2,7 @@ from pathlib import Path
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from pydantic_settings_export.models import SettingsInfoModel
+from pydantic_settings_export.models import FieldInfoModel, SettingsInfoModel
 
 from .abstract import AbstractGenerator
 
@@ -25,6 +25,22 @@ class DotEnvSettings(BaseModel):
     )
 
 
+def _render_field(settings_info: SettingsInfoModel, field: FieldInfoModel) -> str:
+    """Render a single field as a .env line."""
+    field_name = f"{settings_info.env_prefix}{field.name.upper()}"
+    if field.alias:
+        field_name = field.alias.upper()
+
+    field_string = f"{field_name}="
+    if not field.is_required:
+        field_string = f"# {field_name}={field.default}"
+
+    if field.examples and field.examples != (field.default,):
+        field_string += "  # " + (", ".join(field.examples))
+
+    return field_string
+
+
 class DotEnvGenerator(AbstractGenerator):
     """The .env example generator."""
 
@@ -42,7 +58,7 @@ class DotEnvGenerator(AbstractGenerator):
             return []
         return [self.settings.root_dir / self.generator_config.name]
 
-    def generate_single(self, settings_info: SettingsInfoModel, level=1) -> str:
+    def generate_single(self, settings_info: SettingsInfoModel, level: int = 1) -> str:
         """Generate a .env example for a pydantic settings class.
 
         :param level: The level of nesting. Used for indentation.
@@ -51,18 +67,7 @@ class DotEnvGenerator(AbstractGenerator):
         """
         result = f"### {settings_info.name}\n\n"
         for field in settings_info.fields:
-            field_name = f"{settings_info.env_prefix}{field.name.upper()}"
-            if field.alias:
-                field_name = field.alias.upper()
-
-            field_string = f"{field_name}="
-            if not field.is_required:
-                field_string = f"# {field_name}={field.default}"
-
-            if field.examples and field.examples != [field.default]:
-                field_string += "  # " + (", ".join(field.examples))
-
-            result += field_string + "\n"
+            result += _render_field(settings_info, field) + "\n"
 
         result = result.strip() + "\n\n"
 
@@ -1,12 +1,14 @@
+import json
+from functools import lru_cache
 from inspect import getdoc, isclass
-from pathlib import Path
+from pathlib import Path, PurePath
 from types import UnionType
-from typing import TYPE_CHECKING, Any, Self, TypeVar
+from typing import TYPE_CHECKING, Any, Self, TypeAlias, TypeVar, cast
 
 from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from pydantic.fields import FieldInfo
 from pydantic_core import PydanticSerializationError, PydanticUndefined
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from pydantic_settings_export.constants import FIELD_TYPE_MAP
 
@@ -21,47 +23,104 @@ __all__ = (
 )
 
 
-BASE_SETTINGS_DOCS = getdoc(BaseSettings).strip()
-BASE_MODEL_DOCS = getdoc(BaseModel).strip()
+@lru_cache(maxsize=1)
+def _base_docs() -> frozenset[str]:
+    """Get the docs of the base settings and the base model.
+
+    Computed lazily, on the first generated settings info, instead of at import time.
+    """
+    return frozenset(((getdoc(BaseSettings) or "").strip(), (getdoc(BaseModel) or "").strip()))
+
+
+@lru_cache(maxsize=256)
+def _cached_getdoc(cls_: type) -> str:
+    """Get the docs of the class, walking the MRO only once per class."""
+    return getdoc(cls_) or ""
+
+
+@lru_cache(maxsize=256)
+def _type_adapter(value_type: Any) -> TypeAdapter:
+    """Get the TypeAdapter of the type.
+
+    Building a TypeAdapter builds a new validator/serializer, so it is built only once per type.
+    """
+    return TypeAdapter(value_type)
+
+
+_JSON_PRIMITIVES = frozenset({str, int, bool, type(None)})
+
+
+def _dumps(value: Any) -> str:
+    """Dump the plain value to a compact JSON string, the same way as Pydantic does."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
 
 
 def value_to_jsonable(value: Any, value_type: type | None = None) -> Any:
+    value_cls = type(value)
     if value_type is None:
-        value_type = type(value)
+        value_type = value_cls
+
+    # Primitives and paths don't need the Pydantic serializer, if they match the expected type
+    if value_type is value_cls and (value_cls in _JSON_PRIMITIVES or isinstance(value, PurePath)):
+        return _dumps(str(value) if isinstance(value, PurePath) else value)
+
+    try:
+        adapter = _type_adapter(value_type)
+    except TypeError:
+        # Unhashable types can't be cached
+        adapter = TypeAdapter(value_type)
 
     try:
-        return TypeAdapter(value_type).dump_json(value).decode()
+        return adapter.dump_json(value, warnings=False).decode()
     except PydanticSerializationError:
         return str(value)
 
 
+def _dump_sorted(items: list[Any]) -> str | None:
+    """Dump the sorted items of a set without Pydantic, if all of them are plain values."""
+    if all(type(item) in _JSON_PRIMITIVES for item in items):
+        return _dumps(items)
+    return None
+
+
 def _prepare_example(example: Any, value_type: type | None = None) -> str:
     """Prepare the example for the field."""
-    if isinstance(example, set):
+    if isinstance(example, set | frozenset):
         example = sorted(example)
+        if (result := _dump_sorted(example)) is not None:
+            return result
     return value_to_jsonable(example, value_type)
 
 
-P = TypeVar("P", bound=Path)
+@lru_cache(maxsize=256)
+def _type_name(annotation: Any) -> str:
+    """Get the type name of the annotation."""
+    type_ = FIELD_TYPE_MAP.get(annotation)
+    if type_ is None:
+        # Only look up the name when the annotation is not in the map
+        type_ = annotation.__name__ if annotation else "any"
+    return type_
 
 
-def default_path(default: P, global_settings: PSESettings | None = None) -> P:
-    # Check if default is a Path and is absolute
-    if default.is_absolute():
-        # if we need to replace absolute paths
-        if global_settings and global_settings.relative_to.replace_abs_paths:
-            project_dir = global_settings.project_dir.resolve().absolute()
+_SettingsNode: TypeAlias = tuple["BaseSettings | type[BaseModel]", str, list["FieldInfoModel"], list[int]]
+_SettingsStackItem: TypeAlias = tuple[int, "BaseSettings | type[BaseModel]", str, str, tuple[type, ...]]
+
 
-            # Make the default path relative to the global_settings
-            if default.is_relative_to(project_dir):
-                default = Path(global_settings.relative_to.alias) / default.relative_to(
-                    global_settings.project_dir.resolve().absolute()
-                )
+P = TypeVar("P", bound=PurePath)
 
-        # Make the default path relative to the user's home directory
-        home_dir = Path.home().resolve().absolute()
-        if default.is_relative_to(home_dir):
-            default = "~" / default.relative_to(home_dir)
+
+def default_path(default: P, global_settings: PSESettings | None = None, project_dir: Path | None = None) -> P:
+    # If we need to replace absolute paths, make the default path relative to the project directory
+    if global_settings and global_settings.relative_to.replace_abs_paths:
+        if project_dir is None:
+            project_dir = global_settings.project_dir.resolve().absolute()
+        if default.is_relative_to(project_dir):
+            return cast(P, Path(global_settings.relative_to.alias) / default.relative_to(project_dir))
+
+    # Make the default path relative to the user's home directory
+    home_dir = Path.home().resolve().absolute()
+    if default.is_relative_to(home_dir):
+        return "~" / default.relative_to(home_dir)
 
     return default
 
@@ -75,7 +134,7 @@ class FieldInfoModel(BaseModel):
     type: str = Field(..., description="The type of the field.")
     default: str | None = Field(None, description="The default value of the field as a string.")
     description: str | None = Field(None, description="The description of the field.")
-    examples: list[str] = Field(default_factory=list, description="The example of the field.")
+    examples: tuple[str, ...] = Field(default_factory=tuple, description="The example of the field.")
     alias: str | None = Field(None, description="The alias of the field.")
     deprecated: bool = Field(False, description="Mark this field as an deprecated field.")
 
@@ -85,11 +144,16 @@ class FieldInfoModel(BaseModel):
         return self.default is None
 
     @staticmethod
-    def create_default(field: FieldInfo, global_settings: PSESettings | None = None) -> str | None:
+    def create_default(
+        field: FieldInfo,
+        global_settings: PSESettings | None = None,
+        project_dir: Path | None = None,
+    ) -> str | None:
         """Make the default value for the field.
 
         :param field: The field info to generate the default value for.
         :param global_settings: The global settings.
+        :param project_dir: The resolved project directory. If not set, it is resolved from the global settings.
         :return: The default value for the field as a string, or None if there is no default value.
         """
         default: object | PydanticUndefined = field.default
@@ -100,12 +164,19 @@ class FieldInfoModel(BaseModel):
         if default is PydanticUndefined:
             return None
 
-        if isinstance(default, set):
+        # Plain str/int/bool/None defaults need no preparation, so dump them right away
+        if type(default) in _JSON_PRIMITIVES:
+            return _dumps(default)
+
+        if isinstance(default, set | frozenset):
             default = sorted(default)
+            if (result := _dump_sorted(default)) is not None:
+                return result
 
-        # Validate Path values
-        if isinstance(default, Path):
-            default = default_path(default, global_settings)
+        # Validate Path values (`PurePath` is the base of all the Path flavours).
+        # Relative paths are kept as is, only absolute ones need to be made relative.
+        elif isinstance(default, PurePath) and default.is_absolute():
+            default = default_path(default, global_settings, project_dir)
 
         return value_to_jsonable(default)
 
@@ -115,37 +186,42 @@ class FieldInfoModel(BaseModel):
         name: str,
         field: FieldInfo,
         global_settings: PSESettings | None = None,
+        project_dir: Path | None = None,
     ) -> Self:
         """Generate FieldInfoModel using name and field.
 
         :param name: The name of the field.
         :param field: The field info to generate FieldInfoModel from.
         :param global_settings: The global settings.
+        :param project_dir: The resolved project directory. If not set, it is resolved from the global settings.
         :return: Instance of FieldInfoModel.
         """
         # Parse the annotation of the field
-        annotation = field.annotation
+        annotation: Any = field.annotation
 
         if isinstance(annotation, UnionType):
-            args = list(filter(bool, getattr(annotation, "__args__", [])))
-            annotation = args[0] if args else None
+            annotation = next((arg for arg in annotation.__args__ if arg is not None), None)
 
         # Get the name from the alias if it exists
         name: str = field.alias or name
         # Get the type from the FIELD_TYPE_MAP if it exists
-        type_: str = FIELD_TYPE_MAP.get(annotation, annotation.__name__ if annotation else "any")
+        type_: str = _type_name(annotation)
         # Get the default value from the field if it exists
-        default = cls.create_default(field, global_settings)
+        default = cls.create_default(field, global_settings, project_dir)
         # Get the description from the field if it exists
         description: str | None = field.description or None
         # Get the example from the field if it exists
-        examples: list[str] = [_prepare_example(example, field.annotation) for example in (field.examples or [])]
-        if not examples and default:
-            examples = [default]
+        examples: tuple[str, ...]
+        if field.examples:
+            examples = tuple(_prepare_example(example, field.annotation) for example in field.examples)
+        elif default:
+            examples = (default,)
+        else:
+            examples = ()
         # Get the deprecated status from the field if it exists
-        deprecated: bool = field.deprecated or False
+        deprecated: bool = bool(field.deprecated)
 
-        return cls(
+        return cls.model_construct(
             name=name,
             type=type_,
             default=default,
@@ -182,57 +258,110 @@ class SettingsInfoModel(BaseModel):
         :param prefix: The prefix of the environment variables.
         :param nested_delimiter: The delimiter to use for nested settings.
         :return: Instance of SettingsInfoModel.
+        :raise ValueError: If a nested model is nested in itself.
         """
-        conf = settings.model_config
-        fields_info = settings.model_fields
-
-        # If the settings are a BaseSettings, then we can get the prefix and nested delimiter from the model config
-        if isinstance(settings, BaseSettings) or (isclass(settings) and issubclass(settings, BaseSettings)):
-            prefix = prefix + settings.model_config.get("env_prefix", "")
-            nested_delimiter = settings.model_config.get("env_nested_delimiter", "_")
-
-        child_settings = []
-        fields = []
-        for name, field_info in fields_info.items():
-            if global_settings and global_settings.respect_exclude and field_info.exclude:
-                continue
-            annotation = field_info.annotation
-
-            # If the annotation is a BaseModel (also match to BaseSettings),
-            # then we need to generate a SettingsInfoModel for it
-            if isclass(annotation) and issubclass(annotation, BaseModel):
-                child_settings.append(
-                    cls.from_settings_model(
-                        annotation,
-                        global_settings=global_settings,
-                        # Add the prefix and nested delimiter to the child settings
-                        # We need to change the prefix to uppercase to match the env prefix
-                        prefix=f"{prefix}{name}{nested_delimiter}".upper(),
-                        nested_delimiter=nested_delimiter,
+        # Resolve the project directory once for the whole tree, it can be relative to the current directory
+        project_dir = global_settings.project_dir.resolve().absolute() if global_settings else None
+
+        # Nested models are walked with an explicit stack instead of recursion.
+        # Every node gets its index when it is pushed, and children are always pushed after their parent,
+        # so walking the nodes in reverse order builds every child before its parent.
+        # Every entry also carries the classes of its ancestors, to catch models that nest themselves.
+        nodes: dict[int, _SettingsNode] = {}
+        node_count = 1
+        stack: list[_SettingsStackItem] = [(0, settings, prefix, nested_delimiter, ())]
+        while stack:
+            index, model, model_prefix, model_delimiter, ancestors = stack.pop()
+            ancestors += (model if isclass(model) else type(model),)
+
+            fields_info = model.model_fields
+
+            # If the settings are a BaseSettings, then we can get the prefix and nested delimiter from the model config
+            if isinstance(model, BaseSettings) or (isclass(model) and issubclass(model, BaseSettings)):
+                conf = cast(SettingsConfigDict, model.model_config)
+                model_prefix += conf.get("env_prefix", "")
+                # Newer pydantic-settings versions set the delimiter to `None` by default
+                delimiter = conf.get("env_nested_delimiter")
+                model_delimiter = "_" if delimiter is None else delimiter
+
+            fields: list[FieldInfoModel] = []
+            children: list[int] = []
+            # Bind the hot callables once, outside the loop
+            fields_append = fields.append
+            from_settings_field = FieldInfoModel.from_settings_field
+            # We need to change the child prefix to uppercase to match the env prefix,
+            # so uppercase the parts shared by all the children only once
+            child_prefix = model_prefix.upper()
+            child_delimiter = model_delimiter.upper()
+            for name, field_info in fields_info.items():
+                if global_settings and global_settings.respect_exclude and field_info.exclude:
+                    continue
+                annotation = field_info.annotation
+
+                # If the annotation is a BaseModel (also match to BaseSettings),
+                # then we need to generate a SettingsInfoModel for it
+                if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+                    if annotation in ancestors:
+                        raise ValueError(f"The {name!r} field nests the {annotation.__name__!r} model in itself.")
+                    children.append(node_count)
+                    stack.append(
+                        (
+                            node_count,
+                            annotation,
+                            # Add the prefix and nested delimiter to the child settings
+                            child_prefix + name.upper() + child_delimiter,
+                            model_delimiter,
+                            ancestors,
+                        )
                     )
-                )
-                continue
-            fields.append(FieldInfoModel.from_settings_field(name, field_info, global_settings))
+                    node_count += 1
+                    continue
+                fields_append(from_settings_field(name, field_info, global_settings, project_dir))
+
+            nodes[index] = (model, model_prefix, fields, children)
+
+        results: dict[int, Self] = {}
+        for index in range(node_count - 1, -1, -1):
+            model, model_prefix, fields, children = nodes[index]
+            results[index] = cls._from_parts(model, model_prefix, fields, [results[child] for child in children])
+
+        return results[0]
 
-        docs = getdoc(settings) or ""
+    @classmethod
+    def _from_parts(
+        cls,
+        settings: BaseSettings | type[BaseModel],
+        prefix: str,
+        fields: list[FieldInfoModel],
+        child_settings: list["SettingsInfoModel"],
+    ) -> Self:
+        """Make SettingsInfoModel from the already generated fields and child settings.
+
+        :param settings: The settings model to generate SettingsInfoModel from.
+        :param prefix: The prefix of the environment variables.
+        :param fields: The fields of the settings model.
+        :param child_settings: The child settings of the settings model.
+        :return: Instance of SettingsInfoModel.
+        """
+        docs = _cached_getdoc(settings if isclass(settings) else type(settings)).strip()
 
         # If the docs are the same as the base model/settings docs, then remove them
-        if docs.strip() in (BASE_SETTINGS_DOCS, BASE_MODEL_DOCS):
+        if docs in _base_docs():
             docs = ""
 
         # Remove all text after the first form feed character
         docs = docs.split("\f", 1)[0].strip()
 
-        return cls(
+        return cls.model_construct(
             name=(
                 # Get the title from the settings model if it exists
-                conf.get("title", None)
+                settings.model_config.get("title", None)
                 # Otherwise, get the name from the settings model if it exists
                 or getattr(settings, "__name__", None)
                 # Otherwise, get the class name from the settings model
                 or str(settings.__class__.__name__)
             ),
-            docs=docs.strip(),
+            docs=docs,
             env_prefix=prefix,
             fields=fields,
             child_settings=child_settings,
@@ -1,4 +1,5 @@
 import warnings
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +17,17 @@ __all__ = (
 )
 
 
+# The absolute paths of the env files that are already loaded.
+# Every env file is loaded only once per process, so later changes to it are not picked up.
+_LOADED_ENVS: set[Path] = set()
+
+
+@cache
+def _import_cached(value: str) -> BaseSettings:
+    """Import the settings from the string once per string."""
+    return import_settings_from_string(value)
+
+
 class RelativeToSettings(BaseModel):
     """Settings for the relative directory."""
 
@@ -82,7 +94,7 @@ class PSESettings(TomlSettings):
     @property
     def settings(self) -> list[BaseSettings]:
         """Get the settings."""
-        return [import_settings_from_string(i) for i in self.default_settings or []]
+        return [_import_cached(i) for i in self.default_settings or []]
 
     @model_validator(mode="before")
     @classmethod
@@ -109,12 +121,19 @@ class PSESettings(TomlSettings):
     @model_validator(mode="before")
     @classmethod
     def validate_env_file(cls, data: Any) -> Any:
-        """Validate the env file."""
+        """Validate the env file.
+
+        The env file is loaded only the first time it is seen in the process.
+        """
         if isinstance(data, dict):
             file = data.get("env_file")
             if file is not None:
                 f = Path(file)
-                if f.is_file():
+                # Relative paths point to another file after `chdir`, so remember the absolute ones.
+                # Unlike `resolve()`, `absolute()` walks no symlinks, and the file is only checked on a miss.
+                path = f.absolute()
+                if path not in _LOADED_ENVS and f.is_file():
                     print("Loading env file", f)
                     load_dotenv(file)
+                    _LOADED_ENVS.add(path)
         return data
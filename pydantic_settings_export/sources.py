@@ -1,6 +1,11 @@
+import copy
+import tomllib
 from collections.abc import Sequence
+from functools import lru_cache
+from importlib.resources.abc import Traversable
 from os import PathLike
 from pathlib import Path
+from typing import Any
 
 from pydantic_settings import BaseSettings
 from pydantic_settings.sources import PydanticBaseSettingsSource, PyprojectTomlConfigSettingsSource
@@ -8,6 +13,31 @@ from pydantic_settings.sources import PydanticBaseSettingsSource, PyprojectTomlC
 __all__ = ("TomlSettings",)
 
 
+@lru_cache(maxsize=32)
+def _load_toml_cached(path: Path, mtime_ns: int) -> dict[str, Any]:
+    """Parse the TOML file once per path and modification time.
+
+    :param path: The resolved path to the TOML file.
+    :param mtime_ns: The modification time of the file, so the cache is invalidated when it changes.
+    :return: The parsed TOML data.
+    """
+    return tomllib.loads(path.read_text(encoding="utf-8"))
+
+
+class _CachedPyprojectTomlConfigSettingsSource(PyprojectTomlConfigSettingsSource):
+    """The pyproject.toml source, which parses each file only once until it changes."""
+
+    def _read_file(self, file_path: Path | Traversable) -> dict[str, Any]:
+        # Only the files on disk have a modification time to invalidate the cache with
+        if not isinstance(file_path, PathLike):
+            return super()._read_file(file_path)
+
+        file_path = Path(file_path)
+        data = _load_toml_cached(file_path.resolve(), file_path.stat().st_mtime_ns)
+        # The data can be changed in place after reading, so never share the cached one
+        return copy.deepcopy(data)
+
+
 class TomlSettings(BaseSettings):
     """The sources mixin."""
 
@@ -31,16 +61,17 @@ class TomlSettings(BaseSettings):
         """
         toml_file: PathLike | Sequence[PathLike] | None = settings_cls.model_config.get("toml_file", None)
         base_settings = (init_settings, env_settings, dotenv_settings, file_secret_settings)
+        # `str` is a `Sequence` too, so only unpack the real collections
+        if toml_file is not None and not isinstance(toml_file, str | PathLike):
+            toml_file = toml_file[0] if toml_file else None
         if not toml_file:
             return base_settings
 
-        if isinstance(toml_file, Sequence):
-            toml_file = toml_file[0]
-
-        if Path(toml_file).is_file():
+        toml_path = Path(toml_file)
+        if toml_path.is_file():
             return (
                 init_settings,
-                PyprojectTomlConfigSettingsSource(settings_cls, toml_file=Path(toml_file)),
+                _CachedPyprojectTomlConfigSettingsSource(settings_cls, toml_file=toml_path),
                 env_settings,
                 dotenv_settings,
                 file_secret_settings,
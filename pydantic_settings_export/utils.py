@@ -2,6 +2,8 @@ import argparse
 import importlib
 import sys
 from collections.abc import Sequence
+from functools import lru_cache
+from itertools import chain
 from typing import Any
 
 from pydantic import ImportString, TypeAdapter
@@ -14,33 +16,36 @@ __all__ = (
 )
 
 
-def make_pretty_md_table(header: list[str], rows: list[list[str]]) -> str:  # noqa: C901
+def _emit_table(header: list[str], rows: list[list[str]], col_sizes: list[int]) -> str:
+    """Render the already normalized and sized Markdown table.
+
+    :param header: The header of the table.
+    :param rows: The rows of the table, with a string cell for each header column.
+    :param col_sizes: The width of each column.
+    :return: The prettied Markdown table.
+    """
+    # Slice the separator cells out of the widest one, instead of allocating each of them
+    dashes = "-" * (max(col_sizes, default=0) + 2)
+    # Build the row template once, so every line is padded by a single `str.format` call
+    row_fmt = ("|" + "".join(f" {{:<{size}}} |" for size in col_sizes)).format
+    lines = [row_fmt(*header), "|" + "".join(dashes[: size + 2] + "|" for size in col_sizes)]
+    lines.extend(row_fmt(*row) for row in rows)
+    return "\n".join(lines)
+
+
+def make_pretty_md_table(header: list[str], rows: list[list[str]]) -> str:
     """Make a pretty Markdown table with column alignment.
 
     :param header: The header of the table.
     :param rows: The rows of the table.
     :return: The prettied Markdown table.
     """
-    col_sizes = [len(h) for h in header]
-    for row in rows:
-        for i, cell in enumerate(row):
-            if cell is None:
-                cell = ""
-            col_sizes[i] = max(col_sizes[i], len(cell))
-
-    result = "|"
-    for i, h in enumerate(header):
-        result += f" {h}{' ' * (col_sizes[i] - len(h))} |"
-    result += "\n|"
-    for i, _ in enumerate(header):
-        result += f"{'-' * (col_sizes[i] + 2)}|"
-    for row in rows:
-        result += "\n|"
-        for i, cell in enumerate(row):
-            if cell is None:
-                cell = ""
-            result += f" {cell}{' ' * (col_sizes[i] - len(cell))} |"
-    return result
+    # Normalize the cells to strings, and fill the short rows up to the header with empty cells
+    width = len(header)
+    rows = [["" if cell is None else cell for cell in row] + [""] * (width - len(row)) for row in rows]
+    # Measure each column, with its header, in a single C-level scan
+    col_sizes = [max(map(len, column)) for column in zip(header, *rows, strict=True)]
+    return _emit_table(header, rows, col_sizes)
 
 
 def make_pretty_md_table_from_dict(data: list[dict[str, str | None]]) -> str:
@@ -50,20 +55,46 @@ def make_pretty_md_table_from_dict(data: list[dict[str, str | None]]) -> str:
     :return: The prettied Markdown table.
     """
     # Save unique keys from all rows and save order
-    header: list[str] = list(
-        {
-            # We need only key
-            key: 0
-            for row in data
-            for key in row.keys()
-        }.keys(),
-    )
-    rows = [[row.get(key, None) or "" for key in header] for row in data]
-    return make_pretty_md_table(header, rows)
+    header: list[str] = list(dict.fromkeys(chain.from_iterable(data)))
+
+    # Normalize the cells and size the columns in the same pass over the data
+    col_sizes = list(map(len, header))
+    rows: list[list[str]] = []
+    for row in data:
+        cells = [row.get(key) or "" for key in header]
+        col_sizes = list(map(max, col_sizes, map(len, cells)))
+        rows.append(cells)
+    return _emit_table(header, rows, col_sizes)
+
+
+@lru_cache(maxsize=64)
+def _import_obj(module_name: str, class_name: str) -> Any:
+    """Import the object from the module once per module and class name.
+
+    :param module_name: The name of the module.
+    :param class_name: The name of the object in the module.
+    :raise ValueError: If the class is not in the module.
+    :raise ModuleNotFoundError: If the module is not found.
+    :return: The imported object.
+    """
+    # Skip the import machinery (and its locks) for already imported modules
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+
+    obj = getattr(module, class_name, None)
+    if obj is None:
+        raise ValueError(f"The {class_name!r} is not in the module {module_name!r}.")
+    return obj
 
 
 class ObjectImportAction(argparse.Action):
-    """Import the object from the module."""
+    """Import the object from the module.
+
+    The import is done in two steps: parsing the arguments only collects the 'module:class' strings,
+    and :meth:`resolve` has to be called with the parsed namespace to import them.
+    Until then, the namespace holds the raw strings next to the default objects.
+    """
 
     @staticmethod
     def callback(obj: Any) -> Any:
@@ -80,17 +111,11 @@ class ObjectImportAction(argparse.Action):
         :raise ModuleNotFoundError: If the module is not found.
         :return: The imported object.
         """
-        try:
-            module_name, class_name = value.rsplit(":", 1)
-        except ValueError:
-            raise ValueError(f"The {value!r} is not in the format 'module:class'.") from None
-
-        module = importlib.import_module(module_name)
+        module_name, sep, class_name = value.rpartition(":")
+        if not sep:
+            raise ValueError(f"The {value!r} is not in the format 'module:class'.")
 
-        obj = getattr(module, class_name, None)
-        if obj is None:
-            raise ValueError(f"The {class_name!r} is not in the module {module_name!r}.")
-        return obj
+        return _import_obj(module_name, class_name)
 
     def __call__(
         self,
@@ -99,14 +124,10 @@ class ObjectImportAction(argparse.Action):
         values: str | Sequence[Any] | None,
         option_string: str | None = None,
     ) -> None:
-        """Import the object from the module."""
+        """Collect the values, which are imported later by :meth:`resolve`."""
         if values is None:
             return
 
-        # Add the project directory to the sys.path
-        sys.path.insert(0, str(namespace.project_dir))
-        importlib.invalidate_caches()
-
         if isinstance(values, str):
             values = [values]
 
@@ -116,8 +137,32 @@ class ObjectImportAction(argparse.Action):
         if result == self.default:
             result = []
 
+        result.extend(value for value in values if isinstance(value, str))
+        setattr(namespace, self.dest, result)
+
+    def resolve(self, parser: argparse.ArgumentParser, namespace: argparse.Namespace) -> None:
+        """Import the collected values and replace them with the imported objects.
+
+        This is called after the arguments are parsed,
+        so `--help` and usage errors never touch the import machinery.
+
+        :param parser: The parser, which is used to report the import errors.
+        :param namespace: The parsed namespace.
+        """
+        values = getattr(namespace, self.dest, None)
+        if not values or not any(isinstance(value, str) for value in values):
+            return
+
+        # Add the project directory to the sys.path, only once
+        project_dir = str(namespace.project_dir)
+        if project_dir not in sys.path:
+            sys.path.insert(0, project_dir)
+            importlib.invalidate_caches()
+
+        result = []
         for value in values:
             if not isinstance(value, str):
+                result.append(value)
                 continue
             try:
                 result.append(self.callback(self.import_obj(value)))
@@ -132,8 +177,9 @@ class MissingSettingsError(ValueError):
     """Raised when the settings are missing."""
 
     def __init__(self, missing: dict[str | int, str], settings_path: str = "Settings") -> None:
+        prefix = settings_path + "."
         missing_as_str = "\n".join(
-            f"  - `{k if '.' in k else settings_path + '.' + k}`: {v}"
+            f"  - `{key if '.' in (key := str(k)) else prefix + key}`: {v}"
             #
             for k, v in missing.items()
         )
@@ -144,11 +190,14 @@ class MissingSettingsError(ValueError):
         )
 
 
+_IMPORT_STRING_ADAPTER: TypeAdapter = TypeAdapter(ImportString)
+
+
 def import_settings_from_string(value: str) -> BaseSettings:
     """Import the settings from the string."""
     obj: BaseSettings
     try:
-        obj = TypeAdapter(ImportString).validate_python(value)
+        obj = _IMPORT_STRING_ADAPTER.validate_python(value)
     except ValidationError as err:
         missing: dict[str | int, str] = {}
         for details in err.errors():